@@ -13,6 +13,8 @@ Security Features:
 - Whitelist of allowed imports (only sandbox-approved modules)
 - Execution timeout (default 30 seconds)
 - Memory limit enforcement
+- Optional pre-forked worker processes (EXECUTE_CODE_WORKERS) that keep
+  crashes out of the sandbox server
 - Restricted builtins (no file I/O, no network, no os.system)
 - Output capture and size limits
 
@@ -23,7 +25,7 @@ Example Usage:
     >>> result = execute_code('''
     ... # Search logs and scrub PII in one execution
     ... errors = log_store.search_logs("api", "error", limit=100)
-    ... clean_errors = [privacy.scrub_all_pii(str(e)) for e in errors]
+    ... clean_errors = privacy.scrub_all_pii_batch(errors)
     ... print(f"Found {len(clean_errors)} errors")
     ... for e in clean_errors[:5]:
     ...     print(e)
@@ -31,13 +33,14 @@ Example Usage:
     >>> print(result['output'])
 """
 
+import os
 import sys
-import io
 import traceback
-import signal
-import resource
-from typing import Dict, Any, Optional
-from contextlib import contextmanager
+import threading
+from typing import Dict, Any, Optional, Tuple
+from types import CodeType
+from functools import lru_cache
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
 
 
 # =============================================================================
@@ -53,111 +56,85 @@ MAX_OUTPUT_SIZE = 100000  # 100KB
 # Maximum memory (in bytes) - 256MB
 MAX_MEMORY_BYTES = 256 * 1024 * 1024
 
-# Allowed imports - only sandbox-approved modules
-ALLOWED_IMPORTS = {
-    # Sandbox tools (the main purpose of code execution)
-    'log_store',
-    'privacy',
-    'workspace',       # Persistent storage for checkpoints and state
-    'skills',          # Reusable code patterns
-    'tool_discovery',  # Browse and discover available tools
-
-    # Safe standard library modules
-    'json',
-    're',
-    'math',
-    'datetime',
-    'collections',
-    'itertools',
-    'functools',
-    'operator',
-    'string',
-    'textwrap',
-    'unicodedata',
-    'statistics',
-    'random',
-    'hashlib',
-    'base64',
-    'copy',
-    'pprint',
-    'enum',
-    'dataclasses',
-    'typing',
-    'time',  # For sleep in polling loops
-
-    # Data processing (if available in sandbox)
-    'csv',
-}
-
-# Restricted builtins - remove dangerous functions
-RESTRICTED_BUILTINS = {
-    # Keep safe builtins
-    'abs', 'all', 'any', 'ascii', 'bin', 'bool', 'bytearray', 'bytes',
-    'callable', 'chr', 'classmethod', 'complex', 'dict', 'dir', 'divmod',
-    'enumerate', 'filter', 'float', 'format', 'frozenset', 'getattr',
-    'hasattr', 'hash', 'hex', 'id', 'int', 'isinstance', 'issubclass',
-    'iter', 'len', 'list', 'map', 'max', 'min', 'next', 'object', 'oct',
-    'ord', 'pow', 'print', 'property', 'range', 'repr', 'reversed', 'round',
-    'set', 'setattr', 'slice', 'sorted', 'staticmethod', 'str', 'sum',
-    'super', 'tuple', 'type', 'vars', 'zip',
-
-    # Allow limited exception handling
-    'Exception', 'BaseException', 'ValueError', 'TypeError', 'KeyError',
-    'IndexError', 'AttributeError', 'RuntimeError', 'StopIteration',
-
-    # Allow None, True, False
-    'None', 'True', 'False',
-}
-
-# Explicitly blocked builtins (for documentation)
-BLOCKED_BUILTINS = {
-    'open',           # No file I/O
-    'exec',           # No nested exec
-    'eval',           # No nested eval
-    'compile',        # No code compilation
-    '__import__',     # Controlled via safe_import
-    'input',          # No stdin
-    'breakpoint',     # No debugging
-    'globals',        # No global access
-    'locals',         # Limited local access
-    'memoryview',     # No memory manipulation
-}
+# Allowed imports and restricted builtins live in sandbox_policy, which
+# skills shares without importing this module
+from sandbox_policy import (
+    ALLOWED_IMPORTS,
+    RESTRICTED_BUILTINS,
+    BLOCKED_BUILTINS,
+    SAFE_BUILTINS_TEMPLATE,
+    SAFE_IMPORT,
+    create_safe_import,
+)
 
 
 # =============================================================================
-# SAFE IMPORT MECHANISM
+# EXECUTION ENVIRONMENT
 # =============================================================================
 
-def create_safe_import(allowed_modules: set):
-    """Create a restricted import function that only allows whitelisted modules."""
+class _ExecutionTimeout(TimeoutError):
+    """Raised asynchronously in a worker thread when its deadline passes."""
 
-    def safe_import(name, globals=None, locals=None, fromlist=(), level=0):
-        """Import function that only allows whitelisted modules."""
-        # Get the base module name
-        base_module = name.split('.')[0]
 
-        if base_module not in allowed_modules:
-            raise ImportError(
-                f"Import of '{name}' is not allowed. "
-                f"Allowed modules: {', '.join(sorted(allowed_modules))}"
-            )
+@contextmanager
+def _thread_timeout(seconds: int, message: str):
+    """
+    Enforce a timeout off the main thread, where SIGALRM cannot be used.
 
-        # Use the real __import__ for allowed modules
-        return __builtins__['__import__'](name, globals, locals, fromlist, level)
+    A watchdog timer raises an exception in the executing thread via
+    PyThreadState_SetAsyncExc. The interpreter delivers it at the next
+    eval-loop check, so tight loops are interrupted without a trace hook.
+    """
+    import ctypes
 
-    return safe_import
+    thread_id = threading.get_ident()
+    lock = threading.Lock()
+    state = {'done': False, 'fired': False}
 
+    def on_timeout():
+        with lock:
+            if not state['done']:
+                state['fired'] = True
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                    ctypes.c_ulong(thread_id), ctypes.py_object(_ExecutionTimeout)
+                )
+
+    timer = threading.Timer(seconds, on_timeout)
+    timer.daemon = True
+    timer.start()
+
+    try:
+        yield
+    except _ExecutionTimeout:
+        raise TimeoutError(message) from None
+    finally:
+        with lock:
+            state['done'] = True
+        timer.cancel()
+        if state['fired']:
+            # Clear the exception if it has not been delivered yet
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), None)
 
-# =============================================================================
-# EXECUTION ENVIRONMENT
-# =============================================================================
 
 @contextmanager
 def timeout_handler(seconds: int):
-    """Context manager to enforce execution timeout."""
+    """
+    Context manager to enforce execution timeout.
+
+    Uses SIGALRM on the main thread. Signal handlers can only be installed
+    there, so other threads (e.g. a threaded server) use a watchdog timer.
+    """
+    message = f"Code execution timed out after {seconds} seconds"
+
+    if threading.current_thread() is not threading.main_thread():
+        with _thread_timeout(seconds, message):
+            yield
+        return
+
+    import signal
 
     def signal_handler(signum, frame):
-        raise TimeoutError(f"Code execution timed out after {seconds} seconds")
+        raise TimeoutError(message)
 
     # Set the signal handler
     old_handler = signal.signal(signal.SIGALRM, signal_handler)
@@ -172,28 +149,83 @@ def timeout_handler(seconds: int):
 
 
 def set_memory_limit(max_bytes: int):
-    """Set memory limit for the process."""
+    """
+    Set memory limit for the process.
+
+    Only the soft limit is lowered; the hard limit is left alone because
+    an unprivileged process can never raise it again. Not applied at
+    import: the sandbox server and the worker pool initializer call this
+    explicitly, so modules that merely import execute_code (e.g. skills)
+    keep their own limits.
+    """
+    import resource
+
     try:
-        # Set soft and hard limits
-        resource.setrlimit(resource.RLIMIT_AS, (max_bytes, max_bytes))
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            max_bytes = min(max_bytes, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (max_bytes, hard))
     except (ValueError, resource.error):
         # May not be supported on all platforms
         pass
 
 
-def create_execution_globals(tools_path: str = None) -> Dict[str, Any]:
-    """Create a restricted globals dict for code execution."""
-
-    # Start with restricted builtins
-    import builtins
-    safe_builtins = {
-        name: getattr(builtins, name)
-        for name in RESTRICTED_BUILTINS
-        if hasattr(builtins, name)
-    }
+class _ListWriter:
+    """
+    Minimal file-like object that collects writes into a list of chunks.
+
+    Stops storing text once `cap` characters have been written, so runaway
+    print loops use O(cap) memory instead of growing until the memory limit.
+    """
+
+    __slots__ = ('chunks', 'size', 'cap', 'truncated')
+
+    def __init__(self, cap: int):
+        self.chunks = []
+        self.size = 0
+        self.cap = cap
+        self.truncated = False
+
+    def write(self, s: str) -> int:
+        if not isinstance(s, str):
+            raise TypeError(f"write() argument must be str, not {type(s).__name__}")
+        remaining = self.cap - self.size
+        if len(s) > remaining:
+            self.truncated = True
+            if remaining <= 0:
+                return len(s)
+            s = s[:remaining]
+        self.chunks.append(s)
+        self.size += len(s)
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        return ''.join(self.chunks)
+
 
-    # Add safe import
-    safe_builtins['__import__'] = create_safe_import(ALLOWED_IMPORTS)
+# Serializes in-process execution. contextlib's redirect_stdout swaps the
+# process-wide sys.stdout/sys.stderr, so two overlapping executions on
+# different threads would capture each other's output and could leave
+# sys.stdout pointing at a finished writer.
+_EXEC_LOCK = threading.Lock()
+
+# Prototype globals per tools_path, built once by create_execution_globals
+_PROTO_GLOBALS: Dict[Optional[str], Dict[str, Any]] = {}
+
+
+def _build_execution_globals(tools_path: Optional[str]) -> Tuple[Dict[str, Any], bool]:
+    """
+    Build a fresh restricted globals dict.
+
+    Returns the globals and whether all sandbox tools could be imported.
+    """
+
+    # Start with restricted builtins and add safe import
+    safe_builtins = dict(SAFE_BUILTINS_TEMPLATE)
+    safe_builtins['__import__'] = SAFE_IMPORT
 
     # Create globals with restricted builtins
     exec_globals = {
@@ -222,15 +254,168 @@ def create_execution_globals(tools_path: str = None) -> Dict[str, Any]:
 
     except ImportError as e:
         # Tools may not be available in all environments
-        pass
+        return exec_globals, False
+
+    return exec_globals, True
+
 
+def create_execution_globals(tools_path: str = None) -> Dict[str, Any]:
+    """
+    Create a restricted globals dict for code execution.
+
+    The environment is built once per tools_path and copied on each call.
+    The builtins dict is copied too, so code in one execution cannot alter
+    the builtins seen by the next.
+    """
+    proto = _PROTO_GLOBALS.get(tools_path)
+    if proto is None:
+        proto, complete = _build_execution_globals(tools_path)
+        if complete:
+            # Only cache once the tools imported; retry otherwise
+            _PROTO_GLOBALS[tools_path] = proto
+
+    exec_globals = proto.copy()
+    exec_globals['__builtins__'] = proto['__builtins__'].copy()
     return exec_globals
 
 
+@lru_cache(maxsize=128)
+def _compile_code(code: str) -> CodeType:
+    """Compile sandbox code, caching the code object for repeated submissions."""
+    return compile(code, '<sandbox>', 'exec')
+
+
+# =============================================================================
+# WORKER POOL
+# =============================================================================
+
+# Number of pre-forked worker processes for execute_code. With 0 (default)
+# code runs inside the sandbox server process and multiprocessing is never
+# imported.
+EXECUTE_CODE_WORKERS = int(os.environ.get('EXECUTE_CODE_WORKERS', '0'))
+
+# Extra time to wait for a worker's result beyond the execution timeout
+WORKER_GRACE_SECONDS = 5
+
+_WORKER_POOL = None
+
+
+def _init_worker(tools_path: str) -> None:
+    """Cap memory and warm the restricted environment once per worker process."""
+    set_memory_limit(MAX_MEMORY_BYTES)
+    create_execution_globals(tools_path)
+
+
+def _get_worker_pool(tools_path: str):
+    """Start the worker pool on first use."""
+    global _WORKER_POOL
+    if _WORKER_POOL is None:
+        import multiprocessing
+
+        # Fork so workers inherit the imported tools
+        ctx = multiprocessing.get_context('fork')
+        _WORKER_POOL = ctx.Pool(
+            EXECUTE_CODE_WORKERS,
+            initializer=_init_worker,
+            initargs=(tools_path,)
+        )
+    return _WORKER_POOL
+
+
+def _reset_worker_pool() -> None:
+    """Kill all workers; a fresh pool is started on the next call."""
+    global _WORKER_POOL
+    if _WORKER_POOL is not None:
+        _WORKER_POOL.terminate()
+        _WORKER_POOL = None
+
+
+def _run_code_in_worker(code: str, timeout: int, max_output: int, tools_path: str) -> Dict[str, Any]:
+    """
+    Execute code in a pre-forked worker process.
+
+    A worker that crashes or stops responding only loses its own request:
+    the pool is torn down and restarted instead of the sandbox server.
+    """
+    import multiprocessing
+
+    pool = _get_worker_pool(tools_path)
+    pending = pool.apply_async(_run_code, (code, timeout, max_output, tools_path))
+
+    try:
+        return pending.get(timeout + WORKER_GRACE_SECONDS)
+    except multiprocessing.TimeoutError:
+        _reset_worker_pool()
+        return {
+            'success': False,
+            'output': '',
+            'error': f'Sandbox worker did not respond within {timeout + WORKER_GRACE_SECONDS} seconds',
+            'truncated': False
+        }
+
+
 # =============================================================================
 # MAIN EXECUTION FUNCTION
 # =============================================================================
 
+def _run_code(code: str, timeout: int, max_output: int, tools_path: str) -> Dict[str, Any]:
+    """
+    Execute validated code in this process and build the result dict.
+
+    Calls from different threads run one at a time (see _EXEC_LOCK); the
+    timeout starts once the lock is held.
+    """
+
+    # Capture stdout/stderr
+    captured_output = _ListWriter(max_output)
+
+    result = {
+        'success': False,
+        'output': '',
+        'error': '',
+        'truncated': False
+    }
+
+    try:
+        # Create restricted execution environment
+        exec_globals = create_execution_globals(tools_path)
+        exec_locals = {}
+
+        # Execute with timeout and redirected stdout/stderr
+        with _EXEC_LOCK, redirect_stdout(captured_output), \
+                redirect_stderr(captured_output), timeout_handler(timeout):
+            exec(_compile_code(code), exec_globals, exec_locals)
+
+        result['success'] = True
+
+    except TimeoutError as e:
+        result['error'] = str(e)
+
+    except ImportError as e:
+        result['error'] = f"Import error: {str(e)}"
+
+    except SyntaxError as e:
+        result['error'] = f"Syntax error at line {e.lineno}: {e.msg}"
+
+    except Exception as e:
+        # Capture the traceback for debugging
+        tb = traceback.format_exc()
+        # Only include the relevant part (not the execute_code internals)
+        result['error'] = f"{type(e).__name__}: {str(e)}"
+
+    finally:
+        # Get captured output (already capped at max_output by the writer)
+        output = captured_output.getvalue()
+
+        if captured_output.truncated:
+            output += f"\n... [OUTPUT TRUNCATED - exceeded {max_output} chars]"
+            result['truncated'] = True
+
+        result['output'] = output
+
+    return result
+
+
 def execute_code(
     code: str,
     timeout: int = DEFAULT_TIMEOUT,
@@ -321,67 +506,12 @@ def execute_code(
             'truncated': False
         }
 
-    # Capture stdout
-    old_stdout = sys.stdout
-    old_stderr = sys.stderr
-    captured_output = io.StringIO()
+    tools_path = os.environ.get('TOOLS_PATH', '/home/runner/tools')
 
-    result = {
-        'success': False,
-        'output': '',
-        'error': '',
-        'truncated': False
-    }
-
-    try:
-        # Redirect stdout/stderr
-        sys.stdout = captured_output
-        sys.stderr = captured_output
-
-        # Create restricted execution environment
-        import os
-        tools_path = os.environ.get('TOOLS_PATH', '/home/runner/tools')
-        exec_globals = create_execution_globals(tools_path)
-        exec_locals = {}
-
-        # Execute with timeout
-        with timeout_handler(timeout):
-            exec(code, exec_globals, exec_locals)
-
-        result['success'] = True
+    if EXECUTE_CODE_WORKERS > 0:
+        return _run_code_in_worker(code, timeout, max_output, tools_path)
 
-    except TimeoutError as e:
-        result['error'] = str(e)
-
-    except ImportError as e:
-        result['error'] = f"Import error: {str(e)}"
-
-    except SyntaxError as e:
-        result['error'] = f"Syntax error at line {e.lineno}: {e.msg}"
-
-    except Exception as e:
-        # Capture the traceback for debugging
-        tb = traceback.format_exc()
-        # Only include the relevant part (not the execute_code internals)
-        result['error'] = f"{type(e).__name__}: {str(e)}"
-
-    finally:
-        # Restore stdout/stderr
-        sys.stdout = old_stdout
-        sys.stderr = old_stderr
-
-        # Get captured output
-        output = captured_output.getvalue()
-
-        # Truncate if necessary
-        if len(output) > max_output:
-            output = output[:max_output] + f"\n... [OUTPUT TRUNCATED - exceeded {max_output} chars]"
-            result['truncated'] = True
-
-        result['output'] = output
-        captured_output.close()
-
-    return result
+    return _run_code(code, timeout, max_output, tools_path)
 
 
 def get_available_tools() -> Dict[str, Any]:
@@ -416,11 +546,8 @@ import json
 # Query logs (data stays in sandbox)
 errors = log_store.search_logs("api", "error", limit=100)
 
-# Process locally
-results = []
-for error in errors:
-    clean = privacy.scrub_all_pii(error)
-    results.append(clean)
+# Process locally (one regex pass over the whole batch)
+results = privacy.scrub_all_pii_batch(errors)
 
 # Save checkpoint for later resumption
 workspace.save_checkpoint("error_analysis", {
@@ -17,6 +17,27 @@ import re
 from typing import List, Optional
 
 
+# Mock log data used until a PVC with real logs is mounted. Each entry is
+# (line, needs_service_name); only those lines are formatted per search.
+_MOCK_LOG_LINES = (
+    ("[2024-01-15 10:23:45] [INFO] Service '{service_name}' started successfully", True),
+    ("[2024-01-15 10:24:12] [INFO] User 'alex@company.com' authenticated", False),
+    ("[2024-01-15 10:25:33] [ERROR] Transaction tx-123 failed: Connection timed out", False),
+    ("[2024-01-15 10:26:01] [INFO] User 'bob@company.com' authenticated", False),
+    ("[2024-01-15 10:27:15] [ERROR] Transaction tx-124 failed: Insufficient funds", False),
+    ("[2024-01-15 10:28:42] [WARN] High memory usage detected: 85%", False),
+    ("[2024-01-15 10:29:03] [ERROR] Transaction tx-125 failed: NullPointerException", False),
+    ("[2024-01-15 10:30:21] [INFO] Database connection pool refreshed", False),
+    ("[2024-01-15 10:31:45] [ERROR] API request failed: HTTP 500 Internal Server Error", False),
+    ("[2024-01-15 10:32:10] [INFO] Cache cleared successfully", False),
+    ("[2024-01-15 10:33:28] [ERROR] Failed to process message: Timeout after 30s", False),
+    ("[2024-01-15 10:34:52] [WARN] Retry attempt 3/3 for operation op-456", False),
+    ("[2024-01-15 10:35:16] [ERROR] Database query failed: Connection refused", False),
+    ("[2024-01-15 10:36:39] [INFO] Health check passed", False),
+    ("[2024-01-15 10:37:55] [ERROR] Payment processing failed: Gateway unreachable", False),
+)
+
+
 def search_logs(
     service_name: str,
     keyword: str,
@@ -45,26 +66,14 @@ def search_logs(
     # In a real pattern, this would mount a PVC with actual logs
     # For this example, we use mock data to demonstrate the concept
     
-    mock_logs = f"""
-[2024-01-15 10:23:45] [INFO] Service '{service_name}' started successfully
-[2024-01-15 10:24:12] [INFO] User 'alex@company.com' authenticated
-[2024-01-15 10:25:33] [ERROR] Transaction tx-123 failed: Connection timed out
-[2024-01-15 10:26:01] [INFO] User 'bob@company.com' authenticated
-[2024-01-15 10:27:15] [ERROR] Transaction tx-124 failed: Insufficient funds
-[2024-01-15 10:28:42] [WARN] High memory usage detected: 85%
-[2024-01-15 10:29:03] [ERROR] Transaction tx-125 failed: NullPointerException
-[2024-01-15 10:30:21] [INFO] Database connection pool refreshed
-[2024-01-15 10:31:45] [ERROR] API request failed: HTTP 500 Internal Server Error
-[2024-01-15 10:32:10] [INFO] Cache cleared successfully
-[2024-01-15 10:33:28] [ERROR] Failed to process message: Timeout after 30s
-[2024-01-15 10:34:52] [WARN] Retry attempt 3/3 for operation op-456
-[2024-01-15 10:35:16] [ERROR] Database query failed: Connection refused
-[2024-01-15 10:36:39] [INFO] Health check passed
-[2024-01-15 10:37:55] [ERROR] Payment processing failed: Gateway unreachable
-"""
-    
     results = []
     
+    # Build the bracketed level token once rather than per line
+    level_token = f"[{log_level.upper()}]" if log_level else None
+    
+    # Case-insensitive literal match without lowercasing every line
+    keyword_search = re.compile(re.escape(keyword), re.IGNORECASE).search
+    
     # In a real implementation, you would read from a file:
     # log_path = f"/data/logs/{service_name}.log"
     # if not os.path.exists(log_path):
@@ -73,18 +82,18 @@ def search_logs(
     # with open(log_path, 'r') as f:
     #     for line in f:
     
-    for line in mock_logs.splitlines():
-        if not line.strip():
-            continue
+    # Lines are produced one at a time, so the limit check stops early just
+    # as it will over a real file handle
+    for template, needs_service_name in _MOCK_LOG_LINES:
+        line = template.format(service_name=service_name) if needs_service_name else template
         
         # Filter by log level if specified
-        if log_level:
-            if f"[{log_level.upper()}]" not in line:
-                continue
+        if level_token and level_token not in line:
+            continue
         
         # Search for keyword (case-insensitive)
-        if keyword.lower() in line.lower():
-            results.append(line.strip())
+        if keyword_search(line):
+            results.append(line)
             
             if len(results) >= limit:
                 break
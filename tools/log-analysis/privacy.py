@@ -16,6 +16,116 @@ import re
 from typing import List, Dict, Optional
 
 
+# =============================================================================
+# COMPILED PATTERNS
+# =============================================================================
+
+# Patterns are compiled once at import; scrub_all_pii runs per log line.
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+_PHONE_RES = [
+    re.compile(r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}'),  # (123) 456-7890
+    re.compile(r'\d{3}[-.\s]\d{3}[-.\s]\d{4}'),     # 123-456-7890
+    re.compile(r'\d{10}'),                           # 1234567890
+]
+
+_SSN_RE = re.compile(r'\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b')
+
+# Match 13-19 digit credit card numbers (with optional spaces/dashes)
+_CC_RE = re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}(?:\d{3})?\b')
+
+# Luhn digit doubling lookup: _LUHN_DOUBLE[d] == sum of the digits of 2 * d
+_LUHN_DOUBLE = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+_IP_RE = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
+
+# Simple name detection (capitalized words)
+# In production, use a more sophisticated NER model
+_NAME_RE = re.compile(r'\b[A-Z][a-z]+\b')
+
+# Common capitalized words that aren't names
+_NAME_SKIP_WORDS = frozenset({'the', 'a', 'an', 'this', 'that', 'user', 'admin'})
+
+# All patterns fused into one alternation so scrub_all_pii scans the text
+# once. Order matters: at a given position the first listed kind wins, which
+# matches the order the individual scrubbers were historically applied in.
+_PII_PATTERNS = [
+    ('email', _EMAIL_RE),
+    *((f'phone{i}', p) for i, p in enumerate(_PHONE_RES)),
+    ('ssn', _SSN_RE),
+    ('cc', _CC_RE),
+    ('ip', _IP_RE),
+]
+
+_ALL_PII_PATTERN = '|'.join(f'(?P<{kind}>{p.pattern})' for kind, p in _PII_PATTERNS)
+
+# Compiled with the stdlib engine like the individual scrubbers, so \d, \s
+# and \b keep their Unicode meaning (e.g. non-breaking spaces, non-ASCII
+# digits); ASCII-only engines such as re2 would silently redact less.
+_ALL_PII_RE = re.compile(_ALL_PII_PATTERN)
+
+_REPLACEMENTS = {
+    'email': '[EMAIL_REDACTED]',
+    **{f'phone{i}': '[PHONE_REDACTED]' for i in range(len(_PHONE_RES))},
+    'ssn': '[SSN_REDACTED]',
+    'cc': '[CC_REDACTED]',
+    'ip': '[IP_REDACTED]',
+}
+
+
+def _luhn_valid(number: str) -> bool:
+    """Return True if the digits in number pass the Luhn checksum."""
+    digits = [int(c) for c in number if c.isdecimal()]
+    total = sum(digits[-1::-2]) + sum(_LUHN_DOUBLE[d] for d in digits[-2::-2])
+    return total % 10 == 0
+
+
+def _pii_replacement(match) -> Optional[str]:
+    kind = match.lastgroup
+    # Long numeric IDs also fit the card pattern; only redact real card numbers
+    if kind == 'cc' and not _luhn_valid(match.group()):
+        return None
+    return _REPLACEMENTS[kind]
+
+
+# Digits in the first group of a card candidate (see _CC_RE)
+_CC_GROUP_LEN = 4
+
+
+def _sub_pii(pattern, text: str, replace) -> str:
+    """
+    Like pattern.sub(replace, text), but retries rejected card candidates.
+    
+    replace(match) returns None for a card candidate that failed the Luhn
+    check. Plain sub would consume that candidate's characters, hiding a
+    real card number (or other PII) that overlaps it, e.g. the card in
+    "1000 4532 1234 5678 9014". Instead, only the candidate's first digit
+    group is kept as-is and scanning resumes right after it.
+    """
+    parts = []
+    pos = 0
+    while True:
+        match = pattern.search(text, pos)
+        if match is None:
+            break
+        replacement = replace(match)
+        if replacement is None:
+            skip_to = match.start() + _CC_GROUP_LEN
+            parts.append(text[pos:skip_to])
+            pos = skip_to
+        else:
+            parts.append(text[pos:match.start()])
+            parts.append(replacement)
+            pos = match.end()
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+# Separator for scrub_all_pii_batch. No PII pattern can match across it: it is
+# not a word, digit or whitespace character.
+_BATCH_SEP = '\x00'
+
+
 def scrub_emails(text: str, replacement: str = "[EMAIL_REDACTED]") -> str:
     """
     Removes email addresses from text.
@@ -31,8 +141,7 @@ def scrub_emails(text: str, replacement: str = "[EMAIL_REDACTED]") -> str:
         >>> scrub_emails("Contact john@example.com for help")
         'Contact [EMAIL_REDACTED] for help'
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.sub(email_pattern, replacement, text)
+    return _EMAIL_RE.sub(replacement, text)
 
 
 def scrub_phone_numbers(text: str, replacement: str = "[PHONE_REDACTED]") -> str:
@@ -52,16 +161,9 @@ def scrub_phone_numbers(text: str, replacement: str = "[PHONE_REDACTED]") -> str
     Returns:
         Text with phone numbers replaced
     """
-    # Various phone number patterns
-    patterns = [
-        r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}',  # (123) 456-7890
-        r'\d{3}[-.\s]\d{3}[-.\s]\d{4}',     # 123-456-7890
-        r'\d{10}',                           # 1234567890
-    ]
-    
     result = text
-    for pattern in patterns:
-        result = re.sub(pattern, replacement, result)
+    for pattern in _PHONE_RES:
+        result = pattern.sub(replacement, result)
     
     return result
 
@@ -81,24 +183,33 @@ def scrub_ssn(text: str, replacement: str = "[SSN_REDACTED]") -> str:
     Returns:
         Text with SSNs replaced
     """
-    ssn_pattern = r'\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b'
-    return re.sub(ssn_pattern, replacement, text)
+    return _SSN_RE.sub(replacement, text)
 
 
 def scrub_credit_cards(text: str, replacement: str = "[CC_REDACTED]") -> str:
     """
     Removes credit card numbers from text.
     
+    Only digit sequences that pass the Luhn checksum are redacted, so
+    numeric IDs and timestamps of the same length are left intact.
+    
     Args:
         text: Input text that may contain credit card numbers
         replacement: String to replace credit cards with
     
     Returns:
         Text with credit card numbers replaced
+    
+    Example:
+        >>> scrub_credit_cards("order 1000 4532 1234 5678 9014 today")
+        'order 1000 [CC_REDACTED] today'
+        >>> scrub_credit_cards("batch 20240115 4532-1234-5678-9014")
+        'batch 20240115 [CC_REDACTED]'
     """
-    # Match 13-19 digit credit card numbers (with optional spaces/dashes)
-    cc_pattern = r'\b(?:\d{4}[-\s]?){3}\d{4}(?:\d{3})?\b'
-    return re.sub(cc_pattern, replacement, text)
+    def replace_card(match: re.Match) -> Optional[str]:
+        return replacement if _luhn_valid(match.group()) else None
+    
+    return _sub_pii(_CC_RE, text, replace_card)
 
 
 def scrub_ip_addresses(text: str, replacement: str = "[IP_REDACTED]") -> str:
@@ -112,8 +223,7 @@ def scrub_ip_addresses(text: str, replacement: str = "[IP_REDACTED]") -> str:
     Returns:
         Text with IP addresses replaced
     """
-    ip_pattern = r'\b(?:\d{1,3}\.){3}\d{1,3}\b'
-    return re.sub(ip_pattern, replacement, text)
+    return _IP_RE.sub(replacement, text)
 
 
 def scrub_all_pii(text: str) -> str:
@@ -134,14 +244,35 @@ def scrub_all_pii(text: str) -> str:
         >>> clean = scrub_all_pii(data)
         >>> print(clean)
         'User [EMAIL_REDACTED] at [IP_REDACTED] called [PHONE_REDACTED]'
+        >>> scrub_all_pii("192.168.1.100 12 1000 4532 1234 5678 9014")
+        '[IP_REDACTED] 12 1000 [CC_REDACTED]'
     """
-    result = text
-    result = scrub_emails(result)
-    result = scrub_phone_numbers(result)
-    result = scrub_ssn(result)
-    result = scrub_credit_cards(result)
-    result = scrub_ip_addresses(result)
-    return result
+    return _sub_pii(_ALL_PII_RE, text, _pii_replacement)
+
+
+def scrub_all_pii_batch(texts: List[str]) -> List[str]:
+    """
+    Applies scrub_all_pii to a list of texts in a single regex pass.
+    
+    Prefer this over calling scrub_all_pii in a loop when scrubbing many
+    log lines: the texts are joined, scanned once, and split back apart.
+    NUL characters are used as the separator and are removed from the
+    inputs first.
+    
+    Args:
+        texts: List of input texts that may contain PII
+    
+    Returns:
+        List of anonymized texts, in the same order as the input
+    
+    Example:
+        >>> scrub_all_pii_batch(["mail bob@example.com", "from 10.0.0.1"])
+        ['mail [EMAIL_REDACTED]', 'from [IP_REDACTED]']
+    """
+    if not texts:
+        return []
+    joined = _BATCH_SEP.join(str(t).replace(_BATCH_SEP, '') for t in texts)
+    return _sub_pii(_ALL_PII_RE, joined, _pii_replacement).split(_BATCH_SEP)
 
 
 def anonymize_names(
@@ -172,25 +303,22 @@ def anonymize_names(
     if name_map is None:
         name_map = {}
     
-    # Simple name detection (capitalized words)
-    # In production, use a more sophisticated NER model
-    name_pattern = r'\b[A-Z][a-z]+\b'
-    
-    result = text
-    counter = len(name_map)
-    
-    for match in re.finditer(name_pattern, text):
+    def replace_name(match: re.Match) -> str:
         name = match.group()
         
         # Skip common words that aren't names
-        if name.lower() in ['the', 'a', 'an', 'this', 'that', 'user', 'admin']:
-            continue
+        if name.lower() in _NAME_SKIP_WORDS:
+            return name
         
         if name not in name_map:
-            counter += 1
-            name_map[name] = f"User-{chr(64 + counter)}"  # User-A, User-B, etc.
+            name_map[name] = f"User-{chr(65 + len(name_map))}"  # User-A, User-B, etc.
         
-        result = result.replace(name, name_map[name])
+        return name_map[name]
+    
+    # Replace each match in place in a single scan. Replacing every
+    # occurrence of a name across the whole text per match also rewrote
+    # substrings of other words and re-replaced earlier substitutions.
+    result = _NAME_RE.sub(replace_name, text)
     
     return result, name_map
 
@@ -229,7 +357,7 @@ if __name__ == "__main__":
     Email: john.smith@example.com
     Phone: (555) 123-4567
     SSN: 123-45-6789
-    Credit Card: 4532-1234-5678-9010
+    Credit Card: 4532-1234-5678-9014
     IP Address: 192.168.1.100
     
     Notes: Customer called about billing issue. Contact alice@support.com
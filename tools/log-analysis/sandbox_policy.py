@@ -0,0 +1,134 @@
+"""
+Sandbox Policy - Restricted Builtins and Import Allowlist
+
+This module defines what sandboxed code may use: the allowlist of
+importable modules, the restricted builtins, and the import hook that
+enforces the allowlist. It is shared by execute_code and skills.
+
+The module only defines constants and functions. Importing it has no side
+effects (no resource limits, no environment parsing), so any tool can use
+the policy without inheriting execute_code's process setup.
+
+GitOps: This file is managed via GitOps. Changes require security approval
+via pull request.
+"""
+
+import builtins
+from types import MappingProxyType
+
+
+# =============================================================================
+# SECURITY CONFIGURATION
+# =============================================================================
+
+# Allowed imports - only sandbox-approved modules
+ALLOWED_IMPORTS = frozenset({
+    # Sandbox tools (the main purpose of code execution)
+    'log_store',
+    'privacy',
+    'workspace',       # Persistent storage for checkpoints and state
+    'skills',          # Reusable code patterns
+    'tool_discovery',  # Browse and discover available tools
+
+    # Safe standard library modules
+    'json',
+    're',
+    'math',
+    'datetime',
+    'collections',
+    'itertools',
+    'functools',
+    'operator',
+    'string',
+    'textwrap',
+    'unicodedata',
+    'statistics',
+    'random',
+    'hashlib',
+    'base64',
+    'copy',
+    'pprint',
+    'enum',
+    'dataclasses',
+    'typing',
+    'time',  # For sleep in polling loops
+
+    # Data processing (if available in sandbox)
+    'csv',
+})
+
+# Restricted builtins - remove dangerous functions
+RESTRICTED_BUILTINS = {
+    # Keep safe builtins
+    'abs', 'all', 'any', 'ascii', 'bin', 'bool', 'bytearray', 'bytes',
+    'callable', 'chr', 'classmethod', 'complex', 'dict', 'dir', 'divmod',
+    'enumerate', 'filter', 'float', 'format', 'frozenset', 'getattr',
+    'hasattr', 'hash', 'hex', 'id', 'int', 'isinstance', 'issubclass',
+    'iter', 'len', 'list', 'map', 'max', 'min', 'next', 'object', 'oct',
+    'ord', 'pow', 'print', 'property', 'range', 'repr', 'reversed', 'round',
+    'set', 'setattr', 'slice', 'sorted', 'staticmethod', 'str', 'sum',
+    'super', 'tuple', 'type', 'vars', 'zip',
+
+    # Allow limited exception handling
+    'Exception', 'BaseException', 'ValueError', 'TypeError', 'KeyError',
+    'IndexError', 'AttributeError', 'RuntimeError', 'StopIteration',
+
+    # Allow None, True, False
+    'None', 'True', 'False',
+}
+
+# Snapshot of the allowed builtins, taken once at import (read-only)
+SAFE_BUILTINS_TEMPLATE = MappingProxyType({
+    name: getattr(builtins, name)
+    for name in RESTRICTED_BUILTINS
+    if hasattr(builtins, name)
+})
+
+# Explicitly blocked builtins (for documentation)
+BLOCKED_BUILTINS = {
+    'open',           # No file I/O
+    'exec',           # No nested exec
+    'eval',           # No nested eval
+    'compile',        # No code compilation
+    '__import__',     # Controlled via safe_import
+    'input',          # No stdin
+    'breakpoint',     # No debugging
+    'globals',        # No global access
+    'locals',         # Limited local access
+    'memoryview',     # No memory manipulation
+}
+
+
+# =============================================================================
+# SAFE IMPORT MECHANISM
+# =============================================================================
+
+def create_safe_import(allowed_modules: set):
+    """Create a restricted import function that only allows whitelisted modules."""
+
+    # Bind the real __import__ now. Looking it up through __builtins__ at
+    # call time depends on whether that name is a module or a dict, and
+    # would find safe_import itself if resolved inside a sandbox.
+    real_import = builtins.__import__
+    allowed = frozenset(allowed_modules)
+    allowed_msg = ', '.join(sorted(allowed))
+
+    def safe_import(name, globals=None, locals=None, fromlist=(), level=0):
+        """Import function that only allows whitelisted modules."""
+        # Get the base module name
+        base_module = name.partition('.')[0]
+
+        if base_module not in allowed:
+            raise ImportError(
+                f"Import of '{name}' is not allowed. "
+                f"Allowed modules: {allowed_msg}"
+            )
+
+        # Use the real __import__ for allowed modules
+        return real_import(name, globals, locals, fromlist, level)
+
+    return safe_import
+
+
+# Shared import hook installed in every sandbox's builtins
+SAFE_IMPORT = create_safe_import(ALLOWED_IMPORTS)
@@ -16,6 +16,7 @@ Use Cases:
 Skill Structure:
     /workspace/skills/{skill_name}/
     ├── implementation.py    # The actual code
+    ├── implementation.pyc   # Cached bytecode (regenerated on save)
     ├── SKILL.md            # Documentation for AI discovery
     └── metadata.json       # Parameters, version, author
 
@@ -39,10 +40,19 @@ Example Usage:
 """
 
 import os
+import re
 import json
 import ast
 import sys
-from typing import Dict, Any, List, Optional
+import copy
+import builtins
+import shutil
+import hashlib
+import importlib.util
+import marshal
+from collections import OrderedDict
+from types import CodeType
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -63,6 +73,28 @@ MAX_SKILL_SIZE = 50 * 1024
 # Maximum number of skills
 MAX_SKILLS = 100
 
+# Compiled bytecode cache stored next to implementation.py
+COMPILED_FILE = 'implementation.pyc'
+
+# Maximum number of get_skill results kept in memory
+SKILL_CACHE_SIZE = 128
+
+# Builtins skills get on top of execute_code's restricted set: class
+# definitions need __build_class__, and skills commonly catch these errors
+SKILL_EXTRA_BUILTINS = (
+    '__build_class__',
+    'ArithmeticError', 'AssertionError', 'FileNotFoundError', 'ImportError',
+    'LookupError', 'ModuleNotFoundError', 'NameError', 'NotImplementedError',
+    'OSError', 'OverflowError', 'PermissionError', 'TimeoutError',
+    'UnicodeDecodeError', 'UnicodeEncodeError', 'UnicodeError',
+    'ZeroDivisionError',
+)
+
+# Sandbox tools directory, made importable for skill code
+TOOLS_PATH = os.environ.get('TOOLS_PATH', '/home/runner/tools')
+if TOOLS_PATH not in sys.path:
+    sys.path.insert(0, TOOLS_PATH)
+
 
 # =============================================================================
 # SKILL TEMPLATE
@@ -93,6 +125,12 @@ result = skills.run_skill("{name}"{params_example})
 {example}
 ```
 
+## Environment
+
+Runs with the same restricted builtins and import allowlist as execute_code.
+File I/O (`open`), `eval`, `exec` and `compile` are not available; use the
+`workspace` module for persistent storage.
+
 ## Created
 
 - **Date**: {date}
@@ -104,61 +142,79 @@ result = skills.run_skill("{name}"{params_example})
 # VALIDATION
 # =============================================================================
 
+# Valid skill names: 1-50 letters, numbers, underscores, and hyphens, with
+# at least one letter or number (so not just '_' or '--')
+_SKILL_NAME_RE = re.compile(r'(?=[^A-Za-z0-9]*[A-Za-z0-9])[A-Za-z0-9_-]{1,50}')
+_SKILL_NAME_CHARS_RE = re.compile(r'(?=[^A-Za-z0-9]*[A-Za-z0-9])[A-Za-z0-9_-]+')
+
+# Names that cannot be used for skills
+_RESERVED_SKILL_NAMES = frozenset({'__init__', '__main__', 'setup', 'test', 'config'})
+
+
 def _validate_skill_name(name: str) -> None:
     """Validate skill name is safe and valid."""
     if not name:
         raise ValueError("Skill name cannot be empty")
 
-    if not name.replace('_', '').replace('-', '').isalnum():
+    # One match checks both the character set and the length
+    if not _SKILL_NAME_RE.fullmatch(name):
+        if len(name) > 50 and _SKILL_NAME_CHARS_RE.fullmatch(name):
+            raise ValueError("Skill name must be 50 characters or less")
         raise ValueError(
             f"Invalid skill name '{name}'. "
             "Use only letters, numbers, underscores, and hyphens."
         )
 
-    if len(name) > 50:
-        raise ValueError("Skill name must be 50 characters or less")
-
     # Prevent reserved names
-    reserved = {'__init__', '__main__', 'setup', 'test', 'config'}
-    if name.lower() in reserved:
+    if name.lower() in _RESERVED_SKILL_NAMES:
         raise ValueError(f"Skill name '{name}' is reserved")
 
 
-def _validate_code(code: str) -> Dict[str, Any]:
+def _validate_code(code: str, filename: str = '<skill>') -> Dict[str, Any]:
     """
     Validate Python code is syntactically correct and extract info.
 
+    The code is parsed once; the same AST is compiled, which also catches
+    errors the parser alone accepts (e.g. 'return' outside a function).
+
     Returns dict with:
     - valid: bool
     - functions: list of function names
+    - code_obj: compiled code object (attributed to filename) if valid
     - error: error message if invalid
     """
     if not code or not code.strip():
-        return {'valid': False, 'error': 'Code cannot be empty', 'functions': []}
+        return {'valid': False, 'error': 'Code cannot be empty', 'functions': [], 'code_obj': None}
 
     if len(code) > MAX_SKILL_SIZE:
         return {
             'valid': False,
             'error': f'Code too large ({len(code)} bytes). Maximum: {MAX_SKILL_SIZE}',
-            'functions': []
+            'functions': [],
+            'code_obj': None
         }
 
     try:
         tree = ast.parse(code)
 
-        # Extract function definitions
-        functions = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                functions.append(node.name)
+        # Extract top-level function definitions; run_skill looks functions
+        # up in the module globals, so nested functions and methods are not
+        # callable entry points
+        functions = [
+            node.name for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ]
 
-        return {'valid': True, 'functions': functions, 'error': None}
+        code_obj = compile(tree, filename, 'exec')
+
+        return {'valid': True, 'functions': functions, 'code_obj': code_obj, 'error': None}
 
     except SyntaxError as e:
         return {
             'valid': False,
             'error': f'Syntax error at line {e.lineno}: {e.msg}',
-            'functions': []
+            'functions': [],
+            'code_obj': None
         }
 
 
@@ -168,6 +224,167 @@ def _get_skill_path(name: str) -> Path:
     return Path(SKILLS_DIR) / name
 
 
+def _get_skill_path_unchecked(name: str) -> Path:
+    """Get the path to a skill directory for a name read from SKILLS_DIR."""
+    return Path(SKILLS_DIR) / name
+
+
+def _count_and_contains(name: str) -> Tuple[int, bool]:
+    """
+    Count skills and check whether one is named ``name``.
+
+    Like list_skills, only directories containing implementation.py count
+    as skills. Stops as soon as ``name`` is found, since the count only
+    matters for new skills. Returns (count, found).
+    """
+    count = 0
+    try:
+        with os.scandir(SKILLS_DIR) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if not os.path.isfile(os.path.join(entry.path, 'implementation.py')):
+                    continue
+                if entry.name == name:
+                    return count, True
+                count += 1
+    except FileNotFoundError:
+        pass
+    return count, False
+
+
+def _read_metadata(skill_path: Path, name: str) -> Dict[str, Any]:
+    """Read a skill's metadata.json, with defaults if it is missing."""
+    meta_path = skill_path / 'metadata.json'
+    try:
+        return json.loads(meta_path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return {'name': name, 'description': '', 'functions': []}
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write an already-encoded payload with a single open/write/close."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# =============================================================================
+# COMPILED CODE CACHE
+# =============================================================================
+
+def _compiled_header(code: str) -> bytes:
+    """Header identifying the interpreter and the exact source of a .pyc."""
+    return importlib.util.MAGIC_NUMBER + hashlib.blake2b(
+        code.encode('utf-8'), digest_size=16
+    ).digest()
+
+
+def _write_compiled(impl_path: Path, code: str, code_obj: CodeType) -> None:
+    """Cache a skill's compiled code object next to the source."""
+    try:
+        (impl_path.parent / COMPILED_FILE).write_bytes(
+            _compiled_header(code) + marshal.dumps(code_obj)
+        )
+    except OSError:
+        # The cache is optional; run_skill compiles from source without it
+        pass
+
+
+def _load_compiled(impl_path: Path, code: str) -> Optional[CodeType]:
+    """
+    Load the cached code object for a skill.
+
+    Returns None if the cache is missing, was written by a different Python
+    version, or does not match the current source.
+    """
+    try:
+        data = (impl_path.parent / COMPILED_FILE).read_bytes()
+    except OSError:
+        return None
+
+    header = _compiled_header(code)
+    if not data.startswith(header):
+        return None
+
+    try:
+        return marshal.loads(data[len(header):])
+    except (ValueError, EOFError, TypeError):
+        return None
+
+
+# =============================================================================
+# SKILL CACHE
+# =============================================================================
+
+# Skill name -> (implementation.py mtime_ns, get_skill result, has code,
+# has SKILL.md), oldest first
+_SKILL_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+
+# Skill name -> (source code, globals after executing it); bounded by MAX_SKILLS
+_NAMESPACE_CACHE: Dict[str, tuple] = {}
+
+# (SKILLS_DIR mtime_ns, sorted skill names) from the last list_skills scan
+_LIST_CACHE: Optional[Tuple[int, List[str]]] = None
+
+
+def _cache_get(
+    name: str,
+    mtime_ns: int,
+    include_code: bool,
+    include_md: bool
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached get_skill result if implementation.py is unchanged.
+
+    Misses if the cached entry lacks a part the caller asked for; parts the
+    caller did not ask for are blanked in the returned copy. The copy is
+    deep so callers cannot mutate the nested metadata held in the cache.
+    """
+    entry = _SKILL_CACHE.get(name)
+    if entry is None or entry[0] != mtime_ns:
+        return None
+
+    _, info, has_code, has_md = entry
+    if (include_code and not has_code) or (include_md and not has_md):
+        return None
+
+    _SKILL_CACHE.move_to_end(name)
+    result = copy.deepcopy(info)
+    if not include_code:
+        result['code'] = ""
+    if not include_md:
+        result['skill_md'] = ""
+    return result
+
+
+def _cache_put(
+    name: str,
+    mtime_ns: int,
+    info: Dict[str, Any],
+    has_code: bool,
+    has_md: bool
+) -> None:
+    """Store a deep copy of a get_skill result, evicting the LRU entry."""
+    _SKILL_CACHE[name] = (mtime_ns, copy.deepcopy(info), has_code, has_md)
+    _SKILL_CACHE.move_to_end(name)
+    if len(_SKILL_CACHE) > SKILL_CACHE_SIZE:
+        _SKILL_CACHE.popitem(last=False)
+
+
+def _cache_invalidate(name: str) -> None:
+    """Drop a skill from the caches after it is written or deleted."""
+    global _LIST_CACHE
+    _SKILL_CACHE.pop(name, None)
+    _NAMESPACE_CACHE.pop(name, None)
+    # Directory mtimes can be too coarse to see two changes in a row
+    _LIST_CACHE = None
+
+
 # =============================================================================
 # SKILL OPERATIONS
 # =============================================================================
@@ -192,6 +409,7 @@ def save_skill(
     Args:
         name: Unique skill name (letters, numbers, underscores, hyphens)
         code: Python code implementing the skill. Should define at least one function.
+            It runs in the restricted skill environment (see Security).
         description: Human-readable description of what the skill does
         parameters: Dict of parameter names to descriptions (optional)
         returns: Description of return value
@@ -219,17 +437,23 @@ def save_skill(
         - Code is syntax-validated before saving
         - Skill name is sanitized
         - Size limits enforced
+        - Skills run with execute_code's restricted builtins plus class
+          definitions and common exception types (SKILL_EXTRA_BUILTINS);
+          open, eval, exec and compile are unavailable and only approved
+          imports are allowed
     """
     # Validate name
     _validate_skill_name(name)
 
     # Check skill limit
-    existing = list_skills()
-    if len(existing) >= MAX_SKILLS and name not in existing:
+    count, exists = _count_and_contains(name)
+    if count >= MAX_SKILLS and not exists:
         raise ValueError(f"Maximum number of skills ({MAX_SKILLS}) reached")
 
-    # Validate code
-    validation = _validate_code(code)
+    # Validate and compile code
+    skill_path = _get_skill_path(name)
+    impl_path = skill_path / 'implementation.py'
+    validation = _validate_code(code, str(impl_path))
     if not validation['valid']:
         raise ValueError(f"Invalid code: {validation['error']}")
 
@@ -237,14 +461,11 @@ def save_skill(
         raise ValueError("Code must define at least one function")
 
     # Create skill directory
-    skill_path = _get_skill_path(name)
     skill_path.mkdir(parents=True, exist_ok=True)
 
-    # Write implementation
-    impl_path = skill_path / 'implementation.py'
-    impl_path.write_text(code, encoding='utf-8')
-
-    # Write metadata
+    # Build metadata
+    now = datetime.now()
+    timestamp = now.isoformat()
     metadata = {
         'name': name,
         'description': description,
@@ -252,21 +473,19 @@ def save_skill(
         'returns': returns,
         'functions': validation['functions'],
         'version': version,
-        'created': datetime.now().isoformat(),
-        'updated': datetime.now().isoformat()
+        'created': timestamp,
+        'updated': timestamp
     }
 
-    meta_path = skill_path / 'metadata.json'
-    meta_path.write_text(json.dumps(metadata, indent=2), encoding='utf-8')
+    # Generate SKILL.md, building the parameter docs and example in one pass
+    param_lines = []
+    param_args = []
+    for k, v in (parameters or {}).items():
+        param_lines.append(f"- `{k}`: {v}")
+        param_args.append(f'{k}="..."')
 
-    # Generate SKILL.md
-    params_text = "None" if not parameters else "\n".join(
-        f"- `{k}`: {v}" for k, v in parameters.items()
-    )
-
-    params_example = ""
-    if parameters:
-        params_example = ", " + ", ".join(f'{k}="..."' for k in parameters.keys())
+    params_text = "\n".join(param_lines) or "None"
+    params_example = (", " + ", ".join(param_args)) if param_args else ""
 
     skill_md = SKILL_MD_TEMPLATE.format(
         name=name,
@@ -275,12 +494,19 @@ def save_skill(
         parameters=params_text,
         returns=returns,
         example=example or f'result = skills.run_skill("{name}")',
-        date=datetime.now().strftime("%Y-%m-%d"),
+        date=now.strftime("%Y-%m-%d"),
         version=version
     )
 
-    md_path = skill_path / 'SKILL.md'
-    md_path.write_text(skill_md, encoding='utf-8')
+    # Write all files only once every payload has been built
+    _write_bytes(impl_path, code.encode('utf-8'))
+    _write_compiled(impl_path, code, validation['code_obj'])
+    _write_bytes(
+        skill_path / 'metadata.json',
+        json.dumps(metadata, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    )
+    _write_bytes(skill_path / 'SKILL.md', skill_md.encode('utf-8'))
+    _cache_invalidate(name)
 
     return {
         'success': True,
@@ -302,27 +528,51 @@ def list_skills() -> List[str]:
         >>> list_skills()
         ['analyze_errors', 'count_by_service', 'scrub_and_summarize']
     """
-    skills_path = Path(SKILLS_DIR)
+    global _LIST_CACHE
 
-    if not skills_path.exists():
+    try:
+        mtime_ns = os.stat(SKILLS_DIR).st_mtime_ns
+    except FileNotFoundError:
         return []
 
-    skills = []
-    for item in skills_path.iterdir():
-        if item.is_dir():
-            # Check if it has implementation.py
-            if (item / 'implementation.py').exists():
-                skills.append(item.name)
+    # Adding or removing a skill directory changes SKILLS_DIR's mtime
+    if _LIST_CACHE is not None and _LIST_CACHE[0] == mtime_ns:
+        return list(_LIST_CACHE[1])
 
-    return sorted(skills)
+    try:
+        entries = os.scandir(SKILLS_DIR)
+    except FileNotFoundError:
+        return []
+
+    # scandir reports the entry type from the directory read itself, so
+    # only the implementation.py probe costs a stat per skill
+    with entries:
+        skills = sorted(
+            entry.name for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+            and os.path.isfile(os.path.join(entry.path, 'implementation.py'))
+        )
+
+    _LIST_CACHE = (mtime_ns, skills)
+    return list(skills)
 
 
-def get_skill(name: str) -> Dict[str, Any]:
+def get_skill(
+    name: str,
+    *,
+    include_code: bool = True,
+    include_md: bool = True
+) -> Dict[str, Any]:
     """
     Get detailed information about a skill.
 
+    Results are cached in memory and reused until implementation.py changes
+    or the skill is saved or deleted through this module.
+
     Args:
         name: Skill name
+        include_code: Read implementation.py (otherwise 'code' is "")
+        include_md: Read SKILL.md (otherwise 'skill_md' is "")
 
     Returns:
         Dict with skill metadata, code, and documentation
@@ -334,25 +584,44 @@ def get_skill(name: str) -> Dict[str, Any]:
     """
     skill_path = _get_skill_path(name)
 
-    if not skill_path.exists():
-        raise FileNotFoundError(f"Skill '{name}' not found")
+    # Serve repeated lookups from memory while implementation.py is unchanged;
+    # a successful stat also proves the skill directory exists
+    impl_path = os.path.join(skill_path, 'implementation.py')
+    try:
+        mtime_ns = os.stat(impl_path).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        mtime_ns = None
+    else:
+        cached = _cache_get(name, mtime_ns, include_code, include_md)
+        if cached is not None:
+            return cached
+
+    # One directory read tells which skill files exist; it is only needed
+    # for SKILL.md or to confirm a skill without implementation.py exists
+    files = {}
+    if include_md or mtime_ns is None:
+        try:
+            with os.scandir(skill_path) as entries:
+                files = {entry.name: entry.path for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Skill '{name}' not found") from None
 
     # Read implementation
-    impl_path = skill_path / 'implementation.py'
-    code = impl_path.read_text(encoding='utf-8') if impl_path.exists() else ""
+    code = ""
+    if include_code and mtime_ns is not None:
+        with open(impl_path, encoding='utf-8') as f:
+            code = f.read()
 
     # Read metadata
-    meta_path = skill_path / 'metadata.json'
-    if meta_path.exists():
-        metadata = json.loads(meta_path.read_text(encoding='utf-8'))
-    else:
-        metadata = {'name': name, 'description': '', 'functions': []}
+    metadata = _read_metadata(skill_path, name)
 
     # Read SKILL.md
-    md_path = skill_path / 'SKILL.md'
-    skill_md = md_path.read_text(encoding='utf-8') if md_path.exists() else ""
+    skill_md = ""
+    if include_md and 'SKILL.md' in files:
+        with open(files['SKILL.md'], encoding='utf-8') as f:
+            skill_md = f.read()
 
-    return {
+    info = {
         'name': name,
         'code': code,
         'metadata': metadata,
@@ -364,6 +633,83 @@ def get_skill(name: str) -> Dict[str, Any]:
         'version': metadata.get('version', '1.0.0')
     }
 
+    if mtime_ns is not None:
+        _cache_put(name, mtime_ns, info, include_code, include_md)
+
+    return info
+
+
+# Sandbox tool modules exposed to skills, imported on first use
+_SANDBOX_MODULES: Optional[Dict[str, Any]] = None
+
+
+def _sandbox_modules() -> Dict[str, Any]:
+    """Import the sandbox tools once and return them by name."""
+    global _SANDBOX_MODULES
+    if _SANDBOX_MODULES is None:
+        try:
+            import log_store
+            import privacy
+            import workspace
+
+            _SANDBOX_MODULES = {
+                'log_store': log_store,
+                'privacy': privacy,
+                'workspace': workspace,
+            }
+        except ImportError:
+            _SANDBOX_MODULES = {}
+    return _SANDBOX_MODULES
+
+
+# Prototype globals for executing skills, copied for each skill
+_SKILL_GLOBALS_PROTO: Optional[Dict[str, Any]] = None
+
+
+def _skill_globals() -> Dict[str, Any]:
+    """
+    Return a fresh copy of the globals skills execute in.
+
+    Skills get the same restricted builtins and import allowlist as
+    execute_code, plus SKILL_EXTRA_BUILTINS. The builtins dict is copied
+    per skill so one skill cannot alter the builtins seen by another.
+    """
+    global _SKILL_GLOBALS_PROTO
+    if _SKILL_GLOBALS_PROTO is None:
+        from sandbox_policy import SAFE_BUILTINS_TEMPLATE, SAFE_IMPORT
+
+        safe_builtins = dict(SAFE_BUILTINS_TEMPLATE)
+        safe_builtins.update(
+            (n, getattr(builtins, n)) for n in SKILL_EXTRA_BUILTINS
+        )
+        safe_builtins['__import__'] = SAFE_IMPORT
+
+        _SKILL_GLOBALS_PROTO = {
+            '__builtins__': safe_builtins,
+            '__name__': '__skill__',
+            **_sandbox_modules(),
+        }
+
+    exec_globals = _SKILL_GLOBALS_PROTO.copy()
+    exec_globals['__builtins__'] = _SKILL_GLOBALS_PROTO['__builtins__'].copy()
+    return exec_globals
+
+
+def _execute_skill(skill_path: str, code: str) -> Dict[str, Any]:
+    """Execute skill code and return the resulting globals."""
+    # Create execution environment with sandbox tools
+    exec_globals = _skill_globals()
+
+    # Execute the skill code to define functions, using the cached
+    # bytecode from save_skill when it matches the source
+    impl_path = Path(skill_path) / 'implementation.py'
+    code_obj = _load_compiled(impl_path, code)
+    if code_obj is None:
+        code_obj = compile(code, str(impl_path), 'exec')
+    exec(code_obj, exec_globals)
+
+    return exec_globals
+
 
 def run_skill(name: str, function: Optional[str] = None, **kwargs) -> Any:
     """
@@ -385,11 +731,16 @@ def run_skill(name: str, function: Optional[str] = None, **kwargs) -> Any:
         >>> print(result)
         {'service': 'api', 'count': 42}
 
+    Note:
+        The skill's module body runs once and its globals are reused by
+        later calls until the skill is saved again or its source changes.
+
     Security:
-        - Skill code runs in the same restricted environment as execute_code
+        - Skill code runs in the same restricted environment as execute_code,
+          plus class definitions and common exception types
         - Only approved imports are available
     """
-    skill_info = get_skill(name)
+    skill_info = get_skill(name, include_md=False)
     code = skill_info['code']
     functions = skill_info['functions']
 
@@ -407,30 +758,14 @@ def run_skill(name: str, function: Optional[str] = None, **kwargs) -> Any:
     else:
         target_function = functions[0]
 
-    # Create execution environment with sandbox tools
-    tools_path = os.environ.get('TOOLS_PATH', '/home/runner/tools')
-    if tools_path not in sys.path:
-        sys.path.insert(0, tools_path)
-
-    exec_globals = {
-        '__builtins__': __builtins__,
-        '__name__': '__skill__',
-    }
-
-    # Import sandbox tools
-    try:
-        import log_store
-        import privacy
-        import workspace
-
-        exec_globals['log_store'] = log_store
-        exec_globals['privacy'] = privacy
-        exec_globals['workspace'] = workspace
-    except ImportError:
-        pass
-
-    # Execute the skill code to define functions
-    exec(code, exec_globals)
+    # Reuse the namespace from a previous run while the source is unchanged,
+    # so repeated calls skip compiling and executing the module body
+    cached = _NAMESPACE_CACHE.get(name)
+    if cached is not None and cached[0] == code:
+        exec_globals = cached[1]
+    else:
+        exec_globals = _execute_skill(skill_info['path'], code)
+        _NAMESPACE_CACHE[name] = (code, exec_globals)
 
     # Get and call the target function
     if target_function not in exec_globals:
@@ -459,12 +794,9 @@ def delete_skill(name: str) -> Dict[str, Any]:
     if not skill_path.exists():
         raise FileNotFoundError(f"Skill '{name}' not found")
 
-    # Remove all files in skill directory
-    for file in skill_path.iterdir():
-        file.unlink()
-
-    # Remove directory
-    skill_path.rmdir()
+    # Remove the skill directory and everything in it
+    shutil.rmtree(skill_path)
+    _cache_invalidate(name)
 
     return {
         'success': True,
@@ -496,21 +828,33 @@ def update_skill(
     Returns:
         Dict with status and updated info
     """
-    # Get existing skill
-    existing = get_skill(name)
+    # Get existing skill metadata; the code is only read if it is kept
+    skill_path = _get_skill_path(name)
+
+    if not skill_path.exists():
+        raise FileNotFoundError(f"Skill '{name}' not found")
+
+    metadata = _read_metadata(skill_path, name)
+
+    if code is None:
+        impl_path = skill_path / 'implementation.py'
+        code = impl_path.read_text(encoding='utf-8') if impl_path.exists() else ""
 
     # Merge with updates
-    new_code = code if code is not None else existing['code']
-    new_description = description if description is not None else existing['description']
-    new_parameters = parameters if parameters is not None else existing['parameters']
-    new_returns = returns if returns is not None else existing['metadata'].get('returns', '')
+    new_code = code
+    new_description = description if description is not None else metadata.get('description', '')
+    new_parameters = parameters if parameters is not None else metadata.get('parameters', {})
+    new_returns = returns if returns is not None else metadata.get('returns', '')
     new_example = example if example is not None else ""
 
-    # Increment version
-    old_version = existing['version']
-    parts = old_version.split('.')
-    parts[-1] = str(int(parts[-1]) + 1)
-    new_version = '.'.join(parts)
+    # Increment version (last dotted component); start over at 1.0.1 if
+    # the stored version has no numeric last component
+    old_version = str(metadata.get('version', '1.0.0'))
+    i = old_version.rfind('.')
+    try:
+        new_version = f"{old_version[:i + 1]}{int(old_version[i + 1:]) + 1}"
+    except ValueError:
+        new_version = "1.0.1"
 
     # Save updated skill
     return save_skill(
@@ -543,16 +887,18 @@ def search_skills(query: str) -> List[Dict[str, Any]]:
 
     for skill_name in list_skills():
         try:
-            info = get_skill(skill_name)
+            # Only metadata is needed; skip reading the code and SKILL.md
+            metadata = _read_metadata(_get_skill_path_unchecked(skill_name), skill_name)
+            description = metadata.get('description', '')
 
             # Check if query matches name or description
             if (query_lower in skill_name.lower() or
-                query_lower in info['description'].lower()):
+                query_lower in description.lower()):
                 results.append({
                     'name': skill_name,
-                    'description': info['description'],
-                    'functions': info['functions'],
-                    'version': info['version']
+                    'description': description,
+                    'functions': metadata.get('functions', []),
+                    'version': metadata.get('version', '1.0.0')
                 })
         except Exception:
             continue
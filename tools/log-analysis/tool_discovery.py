@@ -51,9 +51,13 @@ Example Usage:
 import os
 import sys
 import ast
+import hashlib
 import inspect
+import importlib
 import json
-from typing import Dict, Any, List, Optional, Callable
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Dict, Any, List, Optional, Callable, Union
 from pathlib import Path
 from datetime import datetime
 
@@ -66,101 +70,194 @@ from datetime import datetime
 TOOLS_DIR = "/workspace/tools"
 
 # Tools to expose (must match execute_code ALLOWED_IMPORTS sandbox tools)
-SANDBOX_TOOLS = ['log_store', 'privacy', 'workspace', 'skills']
+SANDBOX_TOOLS = ('log_store', 'privacy', 'workspace', 'skills')
 
 # Marker file to track when stubs were generated
 MARKER_FILE = ".tool_stubs_generated"
 
 
+# =============================================================================
+# STUB TEMPLATES
+# =============================================================================
+
+FUNCTION_STUB_TEMPLATE = '''"""
+{name} - Function from {module} module
+
+This is a stub file for AI discovery. The actual implementation
+runs in the sandbox environment.
+
+To use this function:
+    import {module}
+    result = {module}.{name}(...)
+
+"""
+
+# Function signature:
+{signature}:
+    {docstring}
+    pass  # Implementation in sandbox
+
+
+# Example usage:
+# >>> import {module}
+# >>> result = {module}.{name}(...)
+'''
+
+
 # =============================================================================
 # STUB GENERATION
 # =============================================================================
 
+# Introspection results per function object. Tool modules are imported once
+# per process, so these only grow with the number of tool functions.
+_SIG_CACHE: Dict[Callable, str] = {}
+_DOC_CACHE: Dict[Callable, Optional[str]] = {}
+_DOC_FIRST_CACHE: Dict[Callable, str] = {}
+
+
 def _get_function_signature(func: Callable) -> str:
     """Extract function signature with type hints."""
+    sig = _SIG_CACHE.get(func)
+    if sig is None:
+        try:
+            sig = f"def {func.__name__}{inspect.signature(func)}"
+        except (ValueError, TypeError):
+            sig = f"def {func.__name__}(*args, **kwargs)"
+        _SIG_CACHE[func] = sig
+    return sig
+
+
+def _get_doc(func: Callable) -> Optional[str]:
+    """Get the cleaned docstring of a function, or None."""
     try:
-        sig = inspect.signature(func)
-        return f"def {func.__name__}{sig}"
-    except (ValueError, TypeError):
-        return f"def {func.__name__}(*args, **kwargs)"
+        return _DOC_CACHE[func]
+    except KeyError:
+        doc = _DOC_CACHE[func] = inspect.getdoc(func)
+        return doc
+
+
+def _get_doc_first_line(func: Callable) -> str:
+    """Get the first line of a function's docstring."""
+    first = _DOC_FIRST_CACHE.get(func)
+    if first is None:
+        first = _DOC_FIRST_CACHE[func] = (_get_doc(func) or "No description").partition('\n')[0]
+    return first
 
 
 def _get_function_docstring(func: Callable) -> str:
     """Extract and format function docstring."""
-    doc = inspect.getdoc(func)
+    doc = _get_doc(func)
     if doc:
         return f'"""\n{doc}\n"""'
     return '"""No documentation available."""'
 
 
-def _generate_function_stub(func: Callable, module_name: str) -> str:
-    """Generate a stub file for a single function."""
-    signature = _get_function_signature(func)
-    docstring = _get_function_docstring(func)
+# Tool modules by name, or the ImportError raised when importing them
+_MODULE_CACHE: Dict[str, Union[ModuleType, ImportError]] = {}
+
+
+def _get_module(module_name: str) -> ModuleType:
+    """
+    Import a tool module once and return it.
+
+    Import failures are cached too, so unavailable modules are not retried.
 
-    # Get source code if available (for type hints)
+    Raises:
+        ImportError: If the module is not available
+    """
     try:
-        source = inspect.getsource(func)
-        # Extract just the function definition and docstring for stub
-    except (OSError, TypeError):
-        source = None
+        module = _MODULE_CACHE[module_name]
+    except KeyError:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            module = e
+        _MODULE_CACHE[module_name] = module
 
-    stub = f'''"""
-{func.__name__} - Function from {module_name} module
+    if isinstance(module, ImportError):
+        raise module.with_traceback(None)
+    return module
 
-This is a stub file for AI discovery. The actual implementation
-runs in the sandbox environment.
 
-To use this function:
-    import {module_name}
-    result = {module_name}.{func.__name__}(...)
+@dataclass(slots=True)
+class FuncInfo:
+    """Introspected details of one public tool function."""
+    name: str
+    func: Callable
+    signature: str
+    doc_first: str
+    full_doc: Optional[str]
 
-"""
 
-# Function signature:
-{signature}:
-    {docstring}
-    pass  # Implementation in sandbox
+# Public functions per module name, introspected once per process
+_MODULE_FUNCS_CACHE: Dict[str, List[FuncInfo]] = {}
 
 
-# Example usage:
-# >>> import {module_name}
-# >>> result = {module_name}.{func.__name__}(...)
-'''
-    return stub
+def _get_public_functions(module_name: str) -> List[FuncInfo]:
+    """
+    Get the public functions of a tool module, sorted by name.
 
+    Raises:
+        ImportError: If the module is not available
+    """
+    functions = _MODULE_FUNCS_CACHE.get(module_name)
+    if functions is None:
+        module = _get_module(module_name)
+        functions = [
+            FuncInfo(
+                name=name,
+                func=obj,
+                signature=_get_function_signature(obj),
+                doc_first=_get_doc_first_line(obj),
+                full_doc=_get_doc(obj)
+            )
+            for name, obj in inspect.getmembers(module, inspect.isfunction)
+            if not name.startswith('_')
+        ]
+        _MODULE_FUNCS_CACHE[module_name] = functions
+    return functions
 
-def _generate_module_init(module, module_name: str) -> str:
-    """Generate __init__.py content for a module directory."""
-    functions = []
 
-    for name, obj in inspect.getmembers(module):
-        if inspect.isfunction(obj) and not name.startswith('_'):
-            try:
-                sig = _get_function_signature(obj)
-                doc_first_line = (inspect.getdoc(obj) or "No description").split('\n')[0]
-                functions.append({
-                    'name': name,
-                    'signature': sig,
-                    'description': doc_first_line
-                })
-            except Exception:
-                continue
+def _generate_function_stub(func: Callable, module_name: str) -> str:
+    """Generate a stub file for a single function."""
+    signature = _get_function_signature(func)
+    docstring = _get_function_docstring(func)
+
+    return FUNCTION_STUB_TEMPLATE.format_map({
+        'name': func.__name__,
+        'module': module_name,
+        'signature': signature,
+        'docstring': docstring,
+    })
 
+
+def _generate_module_init(module, module_name: str, functions: List[FuncInfo]) -> str:
+    """Generate __init__.py content for a module directory."""
     # Get module docstring
     module_doc = inspect.getdoc(module) or f"{module_name} module"
-    module_doc_first = module_doc.split('\n')[0] if module_doc else module_name
+    module_doc_first = module_doc.partition('\n')[0] if module_doc else module_name
 
-    init_content = f'''"""
+    # One pass over the functions fills all three per-function sections
+    summaries = []
+    all_names = []
+    overview = []
+    for func in functions:
+        summaries.append(f"    - {func.name}: {func.doc_first}\n")
+        all_names.append(f'    "{func.name}",\n')
+        overview.append(f'''
+# {func.name}
+#   {func.signature}
+#   {func.doc_first}
+''')
+
+    return "".join([
+        f'''"""
 {module_name} - {module_doc_first}
 
 Available Functions:
-'''
-
-    for func in functions:
-        init_content += f"    - {func['name']}: {func['description']}\n"
-
-    init_content += f'''
+''',
+        *summaries,
+        f'''
 To use this module:
     import {module_name}
 
@@ -171,24 +268,14 @@ Browse individual function files for detailed documentation and examples.
 # Functions: {len(functions)}
 
 __all__ = [
-'''
-
-    for func in functions:
-        init_content += f'    "{func["name"]}",\n'
-
-    init_content += ''']
+''',
+        *all_names,
+        ''']
 
 # Function Overview:
-'''
-
-    for func in functions:
-        init_content += f'''
-# {func['name']}
-#   {func['signature']}
-#   {func['description']}
-'''
-
-    return init_content
+''',
+        *overview,
+    ])
 
 
 def _generate_index() -> str:
@@ -263,15 +350,48 @@ DESCRIPTIONS = {
     "skills": "Reusable code patterns - save and run common operations"
 }
 
-# Quick reference
-print("MCP Sandbox Tools")
-print("=" * 40)
-for tool in TOOLS:
-    print(f"  {tool}: {DESCRIPTIONS.get(tool, 'No description')}")
+# Quick reference (when run directly; importing this file prints nothing)
+if __name__ == "__main__":
+    print("MCP Sandbox Tools")
+    print("=" * 40)
+    for tool in TOOLS:
+        print(f"  {tool}: {DESCRIPTIONS.get(tool, 'No description')}")
 '''
     return index
 
 
+def _stubs_fingerprint(stubs: List[tuple]) -> str:
+    """Hash the paths and contents of a set of rendered stubs."""
+    digest = hashlib.blake2b(digest_size=16)
+    for stub_path, content in stubs:
+        digest.update(stub_path.encode('utf-8') + b'\0')
+        digest.update(content.encode('utf-8') + b'\0')
+    return digest.hexdigest()
+
+
+def _read_marker(marker_path: str) -> Dict[str, Any]:
+    """Read the marker file written by generate_tool_stubs, or {}."""
+    try:
+        with open(marker_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _stubs_unchanged(marker_path: str, stubs: List[tuple]) -> bool:
+    """
+    Check that every stub exists and is no newer than the marker file.
+
+    The marker is written after the stubs, so a stub modified or recreated
+    since the last generation has a later mtime.
+    """
+    try:
+        marker_mtime = os.stat(marker_path).st_mtime_ns
+        return all(os.stat(stub_path).st_mtime_ns <= marker_mtime for stub_path, _ in stubs)
+    except OSError:
+        return False
+
+
 def generate_tool_stubs(force: bool = False) -> Dict[str, Any]:
     """
     Generate tool stub files in /workspace/tools/ for AI discovery.
@@ -281,7 +401,8 @@ def generate_tool_stubs(force: bool = False) -> Dict[str, Any]:
     than having all documentation loaded into context at once.
 
     Args:
-        force: If True, regenerate stubs even if they already exist
+        force: If True, regenerate stubs even if they already exist. Files
+            are still left untouched if they already match the tools.
 
     Returns:
         Dict containing:
@@ -312,47 +433,38 @@ def generate_tool_stubs(force: bool = False) -> Dict[str, Any]:
         return result
 
     try:
-        # Create tools directory
-        os.makedirs(TOOLS_DIR, exist_ok=True)
-
-        # Generate top-level index
-        index_path = os.path.join(TOOLS_DIR, "index.py")
-        with open(index_path, 'w') as f:
-            f.write(_generate_index())
+        # Render every stub first: (path, content) pairs and the
+        # directories they go in
+        directories = [TOOLS_DIR]
+        stubs = [(os.path.join(TOOLS_DIR, "index.py"), _generate_index())]
 
         total_functions = 0
 
         # Process each sandbox tool module
         for module_name in SANDBOX_TOOLS:
-            try:
-                # Import the module
-                module = __import__(module_name)
+            module_dir = os.path.join(TOOLS_DIR, module_name)
+            directories.append(module_dir)
+            init_path = os.path.join(module_dir, "__init__.py")
 
-                # Create module directory
-                module_dir = os.path.join(TOOLS_DIR, module_name)
-                os.makedirs(module_dir, exist_ok=True)
+            try:
+                # Import the module and introspect its functions once
+                module = _get_module(module_name)
+                functions = _get_public_functions(module_name)
 
                 # Generate __init__.py
-                init_path = os.path.join(module_dir, "__init__.py")
-                with open(init_path, 'w') as f:
-                    f.write(_generate_module_init(module, module_name))
+                stubs.append((init_path, _generate_module_init(module, module_name, functions)))
 
                 # Generate stub for each public function
-                for name, obj in inspect.getmembers(module):
-                    if inspect.isfunction(obj) and not name.startswith('_'):
-                        stub_path = os.path.join(module_dir, f"{name}.py")
-                        with open(stub_path, 'w') as f:
-                            f.write(_generate_function_stub(obj, module_name))
-                        total_functions += 1
+                for info in functions:
+                    stub_path = os.path.join(module_dir, f"{info.name}.py")
+                    stubs.append((stub_path, _generate_function_stub(info.func, module_name)))
+                    total_functions += 1
 
                 result['modules'].append(module_name)
 
             except ImportError as e:
                 # Module not available in this environment
                 # Create placeholder
-                module_dir = os.path.join(TOOLS_DIR, module_name)
-                os.makedirs(module_dir, exist_ok=True)
-
                 placeholder = f'''"""
 {module_name} module
 
@@ -360,18 +472,35 @@ This module is not available in the current environment.
 It will be available when running in the MCP sandbox.
 """
 '''
-                init_path = os.path.join(module_dir, "__init__.py")
-                with open(init_path, 'w') as f:
-                    f.write(placeholder)
+                stubs.append((init_path, placeholder))
 
                 result['modules'].append(f"{module_name} (placeholder)")
 
+        # Skip all writes if the stubs on disk were generated from exactly
+        # this content and none have been removed or edited since
+        fingerprint = _stubs_fingerprint(stubs)
+        if (_read_marker(marker_path).get('fingerprint') == fingerprint
+                and _stubs_unchanged(marker_path, stubs)):
+            result['success'] = True
+            result['functions'] = total_functions
+            result['message'] = f"Tool stubs at {TOOLS_DIR} are up to date ({total_functions} functions)"
+            return result
+
+        # Create all directories, then write all files
+        for directory in directories:
+            os.makedirs(directory, exist_ok=True)
+
+        for stub_path, content in stubs:
+            with open(stub_path, 'w') as f:
+                f.write(content)
+
         # Write marker file
         with open(marker_path, 'w') as f:
             f.write(json.dumps({
                 'generated_at': datetime.now().isoformat(),
                 'modules': result['modules'],
-                'functions': total_functions
+                'functions': total_functions,
+                'fingerprint': fingerprint
             }))
 
         result['success'] = True
@@ -429,24 +558,18 @@ def get_tool_info(module_name: str) -> Dict[str, Any]:
         return result
 
     try:
-        module = __import__(module_name)
-        result['description'] = (inspect.getdoc(module) or "").split('\n')[0]
-
-        for name, obj in inspect.getmembers(module):
-            if inspect.isfunction(obj) and not name.startswith('_'):
-                try:
-                    sig = _get_function_signature(obj)
-                    doc = inspect.getdoc(obj) or "No description"
-                    doc_first = doc.split('\n')[0]
-
-                    result['functions'].append({
-                        'name': name,
-                        'signature': sig,
-                        'description': doc_first,
-                        'full_doc': doc
-                    })
-                except Exception:
-                    continue
+        module = _get_module(module_name)
+        result['description'] = (inspect.getdoc(module) or "").partition('\n')[0]
+
+        result['functions'] = [
+            {
+                'name': info.name,
+                'signature': info.signature,
+                'description': info.doc_first,
+                'full_doc': info.full_doc or "No description"
+            }
+            for info in _get_public_functions(module_name)
+        ]
 
     except ImportError:
         result['description'] = f"Module {module_name} not available in this environment"
@@ -477,11 +600,7 @@ def list_available_tools() -> Dict[str, Any]:
 
     for module_name in SANDBOX_TOOLS:
         try:
-            module = __import__(module_name)
-            functions = [
-                name for name, obj in inspect.getmembers(module)
-                if inspect.isfunction(obj) and not name.startswith('_')
-            ]
+            functions = [info.name for info in _get_public_functions(module_name)]
             result['tools'][module_name] = functions
             result['total_functions'] += len(functions)
         except ImportError:
@@ -490,6 +609,36 @@ def list_available_tools() -> Dict[str, Any]:
     return result
 
 
+# (module, lowercase name, lowercase doc, FuncInfo) for every tool function
+_SEARCH_INDEX: Optional[List[tuple]] = None
+
+
+def _get_search_index() -> List[tuple]:
+    """Build the search_tools index on first use."""
+    global _SEARCH_INDEX
+    if _SEARCH_INDEX is not None:
+        return _SEARCH_INDEX
+
+    # Unavailable modules are skipped; _get_module caches import failures,
+    # so rebuilding later would not pick them up either
+    index = []
+    for module_name in SANDBOX_TOOLS:
+        try:
+            functions = _get_public_functions(module_name)
+        except ImportError:
+            continue
+        for info in functions:
+            index.append((
+                module_name,
+                info.name.lower(),
+                (info.full_doc or "").lower(),
+                info
+            ))
+
+    _SEARCH_INDEX = index
+    return index
+
+
 def search_tools(query: str) -> List[Dict[str, Any]]:
     """
     Search for tools matching a query string.
@@ -509,28 +658,18 @@ def search_tools(query: str) -> List[Dict[str, Any]]:
         privacy.scrub_emails: Removes email addresses from text.
     """
     query_lower = query.lower()
-    results = []
-
-    for module_name in SANDBOX_TOOLS:
-        try:
-            module = __import__(module_name)
-
-            for name, obj in inspect.getmembers(module):
-                if inspect.isfunction(obj) and not name.startswith('_'):
-                    doc = inspect.getdoc(obj) or ""
-
-                    # Search in name and documentation
-                    if query_lower in name.lower() or query_lower in doc.lower():
-                        results.append({
-                            'module': module_name,
-                            'name': name,
-                            'signature': _get_function_signature(obj),
-                            'description': doc.split('\n')[0] if doc else "No description"
-                        })
-        except ImportError:
-            continue
 
-    return results
+    # Search in name and documentation
+    return [
+        {
+            'module': module_name,
+            'name': info.name,
+            'signature': info.signature,
+            'description': info.doc_first
+        }
+        for module_name, name_lower, doc_lower, info in _get_search_index()
+        if query_lower in name_lower or query_lower in doc_lower
+    ]
 
 
 # =============================================================================
@@ -31,6 +31,8 @@ Example Usage:
 
 import os
 import json
+import stat
+import time
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
@@ -48,25 +50,35 @@ MAX_FILE_SIZE = 10 * 1024 * 1024
 # Maximum total workspace size (100MB)
 MAX_WORKSPACE_SIZE = 100 * 1024 * 1024
 
+# Seconds before the cached workspace size is rebuilt with a full scan, to
+# pick up files written outside this module
+WORKSPACE_SIZE_TTL = 30
+
 # Allowed file extensions (for safety)
-ALLOWED_EXTENSIONS = {
+ALLOWED_EXTENSIONS = frozenset({
     '.txt', '.json', '.csv', '.yaml', '.yml', '.md',
     '.py', '.log', '.xml', '.html', '.css', '.js'
-}
+})
+
+# Allowed extensions as listed in error messages
+_ALLOWED_EXT_STR = ', '.join(sorted(ALLOWED_EXTENSIONS))
 
 
 # =============================================================================
 # PATH SECURITY
 # =============================================================================
 
+# Resolved workspace root, computed once; WORKSPACE_BASE is fixed at import
+_WORKSPACE_RESOLVED = Path(WORKSPACE_BASE).resolve()
+
+
 def _sanitize_path(filepath: str) -> Path:
     """
     Sanitize and validate file path to ensure it stays within workspace.
 
     Prevents path traversal attacks like "../../../etc/passwd"
     """
-    # Convert to Path and resolve
-    workspace = Path(WORKSPACE_BASE).resolve()
+    workspace = _WORKSPACE_RESOLVED
 
     # Handle relative and absolute paths
     if filepath.startswith('/'):
@@ -90,27 +102,78 @@ def _sanitize_path(filepath: str) -> Path:
 
 def _check_extension(filepath: str) -> None:
     """Validate file extension is allowed."""
-    ext = Path(filepath).suffix.lower()
+    # Same rule as Path.suffix, applied to the normalized final component
+    # so "x.exe/sub/.." is checked as the "x.exe" it refers to
+    name = os.path.basename(os.path.normpath(filepath))
+    i = name.rfind('.')
+    ext = name[i:].lower() if 0 < i < len(name) - 1 else ''
     if ext and ext not in ALLOWED_EXTENSIONS:
         raise ValueError(
             f"File extension '{ext}' not allowed. "
-            f"Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+            f"Allowed: {_ALLOWED_EXT_STR}"
         )
 
 
+def _walk(path: str):
+    """
+    Yield os.DirEntry objects for everything below path.
+
+    Matches Path.rglob('*'): symlinked directories are listed but not
+    descended into, and unreadable directories are skipped. DirEntry caches
+    the file type from the directory read, saving a stat per entry.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except PermissionError:
+        return
+
+    for entry in entries:
+        yield entry
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+        if is_dir:
+            yield from _walk(entry.path)
+
+
+# Running total of workspace bytes, kept up to date by write_file and
+# delete_file so quota checks do not rescan the whole workspace. None until
+# the first scan; rebuilt after WORKSPACE_SIZE_TTL seconds and resynced by
+# get_workspace_info.
+_WORKSPACE_SIZE_CACHE: Optional[int] = None
+_WORKSPACE_SIZE_SCANNED = 0.0
+
+
 def _get_workspace_size() -> int:
     """Calculate total size of workspace directory."""
+    global _WORKSPACE_SIZE_CACHE, _WORKSPACE_SIZE_SCANNED
+    if (_WORKSPACE_SIZE_CACHE is not None
+            and time.monotonic() - _WORKSPACE_SIZE_SCANNED < WORKSPACE_SIZE_TTL):
+        return _WORKSPACE_SIZE_CACHE
+
     workspace = Path(WORKSPACE_BASE)
     if not workspace.exists():
         return 0
 
     total = 0
-    for path in workspace.rglob('*'):
-        if path.is_file():
-            total += path.stat().st_size
+    for entry in _walk(WORKSPACE_BASE):
+        if entry.is_file():
+            total += entry.stat().st_size
+
+    _WORKSPACE_SIZE_CACHE = total
+    _WORKSPACE_SIZE_SCANNED = time.monotonic()
     return total
 
 
+def _adjust_workspace_size(delta: int) -> None:
+    """Apply a size change to the cached workspace total, if any."""
+    global _WORKSPACE_SIZE_CACHE
+    if _WORKSPACE_SIZE_CACHE is not None:
+        _WORKSPACE_SIZE_CACHE = max(0, _WORKSPACE_SIZE_CACHE + delta)
+
+
 # =============================================================================
 # FILE OPERATIONS
 # =============================================================================
@@ -158,15 +221,21 @@ def write_file(filepath: str, content: str, overwrite: bool = True) -> Dict[str,
             f"Adding: {len(content_bytes)}, Max: {MAX_WORKSPACE_SIZE}"
         )
 
-    # Check overwrite
-    if not overwrite and full_path.exists():
+    # Check overwrite; the old size is needed to keep the size total current
+    try:
+        old_size = full_path.stat().st_size
+    except FileNotFoundError:
+        old_size = None
+
+    if not overwrite and old_size is not None:
         raise FileExistsError(f"File already exists: {filepath}")
 
     # Create parent directories
     full_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write file
-    full_path.write_text(content, encoding='utf-8')
+    # Write file (content is already encoded)
+    full_path.write_bytes(content_bytes)
+    _adjust_workspace_size(len(content_bytes) - (old_size or 0))
 
     return {
         'success': True,
@@ -196,10 +265,13 @@ def read_file(filepath: str) -> str:
     """
     full_path = _sanitize_path(filepath)
 
-    if not full_path.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
+    # One stat answers both "exists" and "is a file"
+    try:
+        st = os.stat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"File not found: {filepath}") from None
 
-    if not full_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise IsADirectoryError(f"Path is a directory: {filepath}")
 
     return full_path.read_text(encoding='utf-8')
@@ -221,13 +293,17 @@ def delete_file(filepath: str) -> Dict[str, Any]:
     """
     full_path = _sanitize_path(filepath)
 
-    if not full_path.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
+    # One stat answers "exists", "is a directory" and the size to release
+    try:
+        st = os.stat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"File not found: {filepath}") from None
 
-    if full_path.is_dir():
+    if stat.S_ISDIR(st.st_mode):
         raise IsADirectoryError(f"Cannot delete directory with delete_file: {filepath}")
 
     full_path.unlink()
+    _adjust_workspace_size(-st.st_size)
 
     return {
         'success': True,
@@ -257,7 +333,7 @@ def list_files(directory: str = "", recursive: bool = False) -> List[Dict[str, A
     if directory:
         full_path = _sanitize_path(directory)
     else:
-        full_path = Path(WORKSPACE_BASE)
+        full_path = _WORKSPACE_RESOLVED
 
     if not full_path.exists():
         return []
@@ -267,20 +343,26 @@ def list_files(directory: str = "", recursive: bool = False) -> List[Dict[str, A
 
     files = []
 
+    # Entry paths all start with the resolved workspace root, so names
+    # relative to it are a plain slice
+    scan_path = str(full_path)
+    prefix_len = len(os.path.join(str(_WORKSPACE_RESOLVED), ''))
+
     if recursive:
-        items = full_path.rglob('*')
+        items = _walk(scan_path)
     else:
-        items = full_path.iterdir()
+        with os.scandir(scan_path) as it:
+            items = list(it)
 
     for item in items:
         try:
-            rel_path = item.relative_to(Path(WORKSPACE_BASE))
-            stat = item.stat()
+            rel_path = item.path[prefix_len:]
+            st = item.stat()
 
             files.append({
-                'name': str(rel_path),
+                'name': rel_path,
                 'type': 'directory' if item.is_dir() else 'file',
-                'size': stat.st_size if item.is_file() else 0,
+                'size': st.st_size if item.is_file() else 0,
             })
         except (PermissionError, OSError):
             continue
@@ -303,10 +385,14 @@ def file_exists(filepath: str) -> bool:
     """
     try:
         full_path = _sanitize_path(filepath)
-        return full_path.exists() and full_path.is_file()
     except PermissionError:
         return False
 
+    try:
+        return stat.S_ISREG(os.stat(full_path).st_mode)
+    except OSError:
+        return False
+
 
 def get_workspace_info() -> Dict[str, Any]:
     """
@@ -319,6 +405,7 @@ def get_workspace_info() -> Dict[str, Any]:
         >>> info = get_workspace_info()
         >>> print(f"Using {info['used_bytes']} of {info['max_bytes']}")
     """
+    global _WORKSPACE_SIZE_CACHE, _WORKSPACE_SIZE_SCANNED
     workspace = Path(WORKSPACE_BASE)
 
     file_count = 0
@@ -326,13 +413,18 @@ def get_workspace_info() -> Dict[str, Any]:
     total_size = 0
 
     if workspace.exists():
-        for path in workspace.rglob('*'):
-            if path.is_file():
+        for entry in _walk(WORKSPACE_BASE):
+            if entry.is_file():
                 file_count += 1
-                total_size += path.stat().st_size
-            elif path.is_dir():
+                total_size += entry.stat().st_size
+            elif entry.is_dir():
                 dir_count += 1
 
+        # Resync the running total, which misses writes made outside
+        # write_file (e.g. skills and tool stubs)
+        _WORKSPACE_SIZE_CACHE = total_size
+        _WORKSPACE_SIZE_SCANNED = time.monotonic()
+
     return {
         'workspace_path': WORKSPACE_BASE,
         'exists': workspace.exists(),
@@ -422,12 +514,17 @@ def list_checkpoints() -> List[str]:
     Returns:
         List of checkpoint names (without extension)
     """
-    files = list_files("checkpoints/")
-    return [
-        f['name'].replace('checkpoints/', '').replace('.json', '')
-        for f in files
-        if f['type'] == 'file' and f['name'].endswith('.json')
-    ]
+    try:
+        with os.scandir(_sanitize_path("checkpoints")) as entries:
+            names = [
+                entry.name[:-len('.json')]
+                for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+    return sorted(names)
 
 
 def delete_checkpoint(name: str) -> Dict[str, Any]: